@@ -1,6 +1,10 @@
 import pandas as pd
+import numpy as np
 import re
 
+# Account number pattern: numeric base followed by an optional alphabetic suffix
+_ACCT_RE = re.compile(r'(\d+)([A-Za-z]*)$')
+
 def extract_business_info(account_no):
     """
     Extract base business number and account type from account number.
@@ -16,7 +20,7 @@ def extract_business_info(account_no):
     account_str = str(account_no)
     
     # 알파벳 접미사 패턴 찾기
-    match = re.match(r'(\d+)([A-Za-z]*)$', account_str)
+    match = _ACCT_RE.match(account_str)
     
     if match:
         base_number = match.group(1)  # 기본 번호 (예: 1341)
@@ -53,15 +57,17 @@ def process_account_data(df):
     )
 
     # 고유한 비즈니스 ID 생성
-    unique_base_accounts = df['base_account'].dropna().unique()
-    business_id_map = {base: f"BUS_{i+1:04d}" for i, base in enumerate(sorted(unique_base_accounts))}
+    codes, unique_base_accounts = pd.factorize(df['base_account'], sort=True)
+    # Trailing None label maps the -1 code of missing base accounts to None
+    business_id_labels = np.array([f"BUS_{i+1:04d}" for i in range(len(unique_base_accounts))] + [None], dtype=object)
 
     # 비즈니스 ID 추가
-    df['business_id'] = df['base_account'].map(business_id_map)
+    df['business_id'] = business_id_labels[codes]
 
     # 데이터 분석을 위한 추가 컬럼들
     df['is_main_account'] = df['suffix'] == ''  # 메인 계정 여부 (렌즈)
-    df['has_multiple_accounts'] = df.groupby('business_id')['business_id'].transform('count') > 1
+    business_id_counts = df['business_id'].value_counts()
+    df['has_multiple_accounts'] = df['business_id'].map(business_id_counts).to_numpy() > 1
     
     print(f"df: {df.shape}, columns: {list(df.columns)}")
     return df
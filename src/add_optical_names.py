@@ -1,6 +1,5 @@
 import pandas as pd
 import numpy as np
-import random
 
 # 1. Load data
 print("Loading data...")
@@ -32,10 +31,6 @@ optical_words = [
 # 4. Generate consistent optical names by business_id
 print("Generating Optical names...")
 
-# Set seed for reproducible results
-np.random.seed(42)
-random.seed(42)
-
 # List of unique business_ids
 unique_business_ids = df['business_id'].dropna().unique()
 
@@ -46,12 +41,11 @@ used_names = set()
 for i, business_id in enumerate(unique_business_ids):
     # Use unique seed for each business_id for consistent results
     business_seed = hash(str(business_id)) % 2147483647
-    np.random.seed(business_seed)
-    random.seed(business_seed)
+    rng = np.random.default_rng(business_seed)
     
     # Generate non-duplicate name
     for attempt in range(100):
-        word = np.random.choice(optical_words)
+        word = rng.choice(optical_words)
         optical_name = f"{word} Optical"
         
         if optical_name not in used_names:
@@ -14,7 +14,6 @@ Features:
 
 import pandas as pd
 import numpy as np
-import random
 from tqdm import tqdm
 import os
 import warnings
@@ -87,10 +86,6 @@ def create_business_id_to_optical_mapping(unique_business_ids, adjectives, nouns
     print(f"=== Generating Optical Names by business_id ===")
     print(f"Number of unique business_ids to process: {len(unique_business_ids)}")
     
-    # Set seed for reproducible results
-    np.random.seed(42)
-    random.seed(42)
-    
     business_id_to_optical = {}
     used_names = set()  # Prevent duplicates
     
@@ -98,14 +93,13 @@ def create_business_id_to_optical_mapping(unique_business_ids, adjectives, nouns
     for i, business_id in enumerate(tqdm(unique_business_ids)):
         # Use unique seed for each business_id for consistent results
         business_seed = hash(str(business_id)) % 2147483647
-        np.random.seed(business_seed)
-        random.seed(business_seed)
+        rng = np.random.default_rng(business_seed)
         
         # Generate non-duplicate name
         max_attempts = 100
         for attempt in range(max_attempts):
-            adj = np.random.choice(adjectives)
-            noun = np.random.choice(nouns)
+            adj = rng.choice(adjectives)
+            noun = rng.choice(nouns)
             optical_name = f"{adj} {noun}"
             
             if optical_name not in used_names:
@@ -9,14 +9,20 @@ def check_inventory_files():
         'data/inventory_final_cleaned.csv',
         'data/inventory_final_anonymous.csv',
         'data/inventory_final_anonymous_cleaned.csv',
-        'data/inventory_final_anonymous_updated.csv'
+        'data/inventory_final_anonymous_updated.parquet'
     ]
     
     for file_path in files_to_check:
         try:
-            df = pd.read_csv(file_path, nrows=5)  # 처음 5행만 읽기
+            if file_path.endswith('.parquet'):
+                full_df = pd.read_parquet(file_path)
+                df = full_df.head(5)
+                row_count = len(full_df)
+            else:
+                df = pd.read_csv(file_path, nrows=5)  # 처음 5행만 읽기
+                row_count = len(pd.read_csv(file_path))
             print(f"\n=== {file_path} ===")
-            print(f"행 수: {len(pd.read_csv(file_path))}")
+            print(f"행 수: {row_count}")
             print(f"컬럼: {list(df.columns)}")
             print("샘플 데이터:")
             print(df.head(3))
@@ -10,14 +10,15 @@ Alternative: Command-line monitoring (less visual and interactive)
 """
 
 import os
+import sys
 import json
 import time
+import argparse
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import logging
 import threading
-import webbrowser
 from http.server import HTTPServer, SimpleHTTPRequestHandler
 import socketserver
 import subprocess
@@ -818,7 +819,7 @@ if __name__ == "__main__":
         with open(self.dashboard_dir / "server.py", 'w') as f:
             f.write(api_handler)
     
-    def start_dashboard_server(self) -> None:
+    def start_dashboard_server(self, open_browser: bool = True) -> None:
         """
         Start dashboard web server
         
@@ -826,6 +827,9 @@ if __name__ == "__main__":
         Why: Provide web-based interface for monitoring
         How: HTTP server with API endpoints
         Alternative: Desktop application (more complex)
+        
+        Args:
+            open_browser: Open the dashboard URL in the default browser
         """
         try:
             # Create dashboard files
@@ -846,10 +850,13 @@ if __name__ == "__main__":
             dashboard_url = f"http://localhost:{self.port}"
             self.logger.info(f"Dashboard available at: {dashboard_url}")
             
-            try:
-                webbrowser.open(dashboard_url)
-            except Exception as e:
-                self.logger.warning(f"Could not open browser automatically: {e}")
+            if open_browser:
+                # Imported lazily: only needed for interactive launches
+                import webbrowser
+                try:
+                    webbrowser.open(dashboard_url)
+                except Exception as e:
+                    self.logger.warning(f"Could not open browser automatically: {e}")
             
             self.is_running = True
             return True
@@ -914,8 +921,6 @@ pgAdmin: http://localhost:5050
 
 def main():
     """Main dashboard entry point"""
-    import argparse
-    
     parser = argparse.ArgumentParser(description="Project Dashboard")
     parser.add_argument('--port', '-p', type=int, default=8080,
                        help='Dashboard port (default: 8080)')
@@ -944,7 +949,7 @@ def main():
         # Start dashboard server
         print("🚀 Starting Project Dashboard...")
         
-        if dashboard.start_dashboard_server():
+        if dashboard.start_dashboard_server(open_browser=not args.no_browser):
             print(f"✅ Dashboard running at http://localhost:{args.port}")
             print("Press Ctrl+C to stop the dashboard")
             
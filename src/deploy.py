@@ -14,10 +14,14 @@ import sys
 import subprocess
 import json
 import time
+import socket
 import argparse
+import contextlib
+import queue
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import logging
+import logging.handlers
 from datetime import datetime
 
 class DeploymentManager:
@@ -42,6 +46,7 @@ class DeploymentManager:
         self.environment = environment
         self.root_path = Path(__file__).parent
         self.deployment_time = datetime.now()
+        self._step_timings: Dict[str, float] = {}
         
         # Set up logging
         self.setup_logging()
@@ -52,23 +57,76 @@ class DeploymentManager:
         self.logger.info(f"Deployment manager initialized for {environment}")
     
     def setup_logging(self) -> None:
-        """Configure deployment logging"""
+        """
+        Configure deployment logging
+        
+        What: File and console logging fed from a single queue
+        Why: Keep record formatting and disk writes off the deploy thread
+        How: QueueHandler on the root logger, QueueListener on a background thread
+        Alternative: Direct File/Stream handlers (block on every record)
+        """
         log_dir = Path("logs")
         log_dir.mkdir(exist_ok=True)
         
         log_file = log_dir / f"deployment_{self.deployment_time.strftime('%Y%m%d_%H%M%S')}.log"
         
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        
+        # The queue handler only merges args into the message; the listener's
+        # handlers apply the real format on the background thread
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+        
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, stream_handler, respect_handler_level=True
         )
+        self._log_listener.start()
         
         self.logger = logging.getLogger('deployment')
     
+    def stop_logging(self) -> None:
+        """Flush queued log records and stop the background listener"""
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
+    
+    @contextlib.contextmanager
+    def _timed(self, step_name: str):
+        """Record the wall-clock duration of a deployment step"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._step_timings[step_name] = time.perf_counter() - start
+    
+    def _run(self, cmd: List[str], step: str, check: bool = True) -> subprocess.CompletedProcess:
+        """
+        Run a deployment subprocess with captured output
+        
+        What: Uniform subprocess wrapper for deployment steps
+        Why: Output is only useful when a command fails
+        How: Capture stdout/stderr and log them on non-zero exit
+        Alternative: Inherit parent stdio (noisy and slower)
+        """
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        
+        if result.returncode != 0:
+            self.logger.error(f"{step}: command failed with exit code {result.returncode}: {' '.join(cmd)}")
+            if result.stdout.strip():
+                self.logger.error(f"{step} stdout:\n{result.stdout.strip()}")
+            if result.stderr.strip():
+                self.logger.error(f"{step} stderr:\n{result.stderr.strip()}")
+            if check:
+                raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
+        
+        return result
+    
     def load_environment_config(self) -> Dict[str, Any]:
         """
         Load environment-specific configuration
@@ -194,8 +252,6 @@ class DeploymentManager:
     
     def check_port_availability(self) -> bool:
         """Check if required ports are available"""
-        import socket
-        
         for service, port in self.config["ports"].items():
             if not self.config["services"].get(service, False):
                 continue
@@ -228,7 +284,7 @@ class DeploymentManager:
             venv_path = Path("venv")
             if not venv_path.exists():
                 self.logger.info("Creating virtual environment...")
-                subprocess.run([sys.executable, "-m", "venv", "venv"], check=True)
+                self._run([sys.executable, "-m", "venv", "venv"], "Environment Setup")
             
             # Determine activation script
             if os.name == 'nt':  # Windows
@@ -240,17 +296,17 @@ class DeploymentManager:
             
             # Upgrade pip
             self.logger.info("Upgrading pip...")
-            subprocess.run([str(python_path), "-m", "pip", "install", "--upgrade", "pip"], check=True)
+            self._run([str(python_path), "-m", "pip", "install", "--upgrade", "pip"], "Environment Setup")
             
             # Install requirements
             self.logger.info("Installing requirements...")
-            subprocess.run([str(pip_path), "install", "-r", "requirements.txt"], check=True)
+            self._run([str(pip_path), "install", "-r", "requirements.txt"], "Environment Setup")
             
             # Install additional development dependencies if needed
             if self.environment == "development":
                 dev_requirements = Path("requirements-dev.txt")
                 if dev_requirements.exists():
-                    subprocess.run([str(pip_path), "install", "-r", "requirements-dev.txt"], check=True)
+                    self._run([str(pip_path), "install", "-r", "requirements-dev.txt"], "Environment Setup")
             
             self.logger.info("Python environment setup completed")
             return True
@@ -344,15 +400,15 @@ DEBUG={'true' if self.environment == 'development' else 'false'}
         try:
             # Stop existing services
             self.logger.info("Stopping existing services...")
-            subprocess.run(['docker-compose', 'down'], check=False)
+            self._run(['docker-compose', 'down'], "Service Deployment", check=False)
             
             # Pull latest images
             self.logger.info("Pulling Docker images...")
-            subprocess.run(['docker-compose', 'pull'], check=True)
+            self._run(['docker-compose', 'pull'], "Service Deployment")
             
             # Start services
             self.logger.info("Starting services...")
-            subprocess.run(['docker-compose', 'up', '-d'], check=True)
+            self._run(['docker-compose', 'up', '-d'], "Service Deployment")
             
             # Wait for services to be ready
             self.logger.info("Waiting for services to be ready...")
@@ -404,24 +460,37 @@ DEBUG={'true' if self.environment == 'development' else 'false'}
             # Wait for database to be ready
             time.sleep(10)
             
-            # Run schema creation
-            schema_file = Path("sql/schema.sql")
-            if schema_file.exists():
+            # Bundle migrations into a single psql session. sql/schema.sql is not
+            # included: postgres already loads it once at init via
+            # docker-entrypoint-initdb.d, and it is not idempotent.
+            sql_files = []
+            migrations_dir = Path("sql/migrations")
+            if migrations_dir.exists():
+                sql_files.extend(sorted(migrations_dir.glob("*.sql")))
+            
+            if not sql_files:
+                self.logger.info("No migrations found, skipping")
+                return True
+            
+            for sql_file in sql_files:
+                self.logger.info(f"Bundling migration: {sql_file}")
+            
+            # ./sql is bind-mounted at /sql in the postgres container
+            merged_file = Path("sql/.merged.sql")
+            merged_file.write_text('\n'.join(p.read_text() for p in sql_files))
+            
+            try:
                 cmd = [
                     'docker-compose', 'exec', '-T', 'postgres',
                     'psql', '-U', 'optical_admin', '-d', 'optical_analytics',
-                    '-f', '/docker-entrypoint-initdb.d/schema.sql'
+                    '-v', 'ON_ERROR_STOP=1', '--single-transaction',
+                    '-f', '/sql/.merged.sql'
                 ]
-                subprocess.run(cmd, check=True)
-                self.logger.info("Database schema created")
+                self._run(cmd, "Database Migrations")
+            finally:
+                merged_file.unlink(missing_ok=True)
             
-            # Run any additional migrations
-            migrations_dir = Path("sql/migrations")
-            if migrations_dir.exists():
-                for migration_file in sorted(migrations_dir.glob("*.sql")):
-                    self.logger.info(f"Running migration: {migration_file.name}")
-                    # Execute migration
-                    # This would typically involve more sophisticated migration tracking
+            self.logger.info(f"Applied {len(sql_files)} SQL file(s) in one transaction")
             
             return True
             
@@ -449,13 +518,12 @@ DEBUG={'true' if self.environment == 'development' else 'false'}
                 else:
                     python_path = Path("venv/bin/python")
                 
-                result = subprocess.run([str(python_path), str(test_script)], 
-                                      capture_output=True, text=True)
+                result = self._run([str(python_path), str(test_script)], "Test Execution", check=False)
                 
                 if result.returncode == 0:
                     self.logger.info("Configuration tests passed")
                 else:
-                    self.logger.error(f"Configuration tests failed: {result.stderr}")
+                    self.logger.error("Configuration tests failed")
                     return False
             
             # Run additional tests if available
@@ -552,6 +620,7 @@ DEBUG={'true' if self.environment == 'development' else 'false'}
             "duration": deployment_duration.total_seconds(),
             "status": "completed",
             "configuration": self.config,
+            "step_durations_sec": dict(self._step_timings),
             "services": {},
             "health_checks": {}
         }
@@ -593,7 +662,9 @@ DEBUG={'true' if self.environment == 'development' else 'false'}
         for step_name, step_func in deployment_steps:
             self.logger.info(f"Executing: {step_name}")
             try:
-                if not step_func():
+                with self._timed(step_name):
+                    step_ok = step_func()
+                if not step_ok:
                     self.logger.error(f"Deployment failed at step: {step_name}")
                     return False
                 self.logger.info(f"Completed: {step_name}")
@@ -643,7 +714,10 @@ def main():
     if args.skip_tests:
         deployment_manager.config["skip_tests"] = True
     
-    success = deployment_manager.deploy()
+    try:
+        success = deployment_manager.deploy()
+    finally:
+        deployment_manager.stop_logging()
     
     if success:
         print(f"🎉 Deployment to {args.environment} completed successfully!")
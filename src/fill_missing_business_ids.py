@@ -1,18 +1,21 @@
 import pandas as pd
 import numpy as np
-import random
 
 def fill_missing_business_ids():
     """
     Fill missing business_ids in email data using customer data
+    
+    Missing rows receive unused customer business_ids drawn without replacement in
+    a single seeded call (default_rng(42)); ids are only reused once the unused
+    pool is exhausted.
     """
     print("=== Fill Missing Business IDs Process ===")
     
     # 1. Load data
     print("1. Loading data...")
     try:
-        email_df = pd.read_csv('email_customer_matched_full.csv')
-        customer_df = pd.read_csv('processed_customer_data.csv')
+        email_df = pd.read_csv('email_customer_matched_full.csv', engine='pyarrow')
+        customer_df = pd.read_csv('processed_customer_data.csv', engine='pyarrow')
         print(f"✅ Email data loaded: {email_df.shape}")
         print(f"✅ Customer data loaded: {customer_df.shape}")
     except FileNotFoundError as e:
@@ -21,8 +24,11 @@ def fill_missing_business_ids():
     
     # 2. Check business_id status
     print("\n2. Checking business_id status...")
-    email_na_count = email_df['business_id'].isna().sum()
-    email_total = len(email_df)
+    # Snapshot the business_id column and its null mask once; every later step reuses them
+    business_id_values = email_df['business_id'].to_numpy(dtype=object, copy=True)
+    missing_mask = pd.isna(business_id_values)
+    email_na_count = int(missing_mask.sum())
+    email_total = len(business_id_values)
     customer_na_count = customer_df['business_id'].isna().sum()
     customer_total = len(customer_df)
     
@@ -39,60 +45,55 @@ def fill_missing_business_ids():
     # 3. Get available business_ids from customer data
     print("\n3. Getting available business_ids from customer data...")
     available_business_ids = customer_df['business_id'].dropna().unique()
-    used_business_ids = email_df['business_id'].dropna().unique()
+    used_business_ids = pd.unique(business_id_values[~missing_mask])
     
     print(f"Available business_ids in customer data: {len(available_business_ids):,}")
     print(f"Already used business_ids in email data: {len(used_business_ids):,}")
     
-    # 4. Find unused business_ids
-    unused_business_ids = set(available_business_ids) - set(used_business_ids)
-    print(f"Unused business_ids available: {len(unused_business_ids):,}")
+    # 4. Find unused business_ids (both inputs are already unique). With assume_unique
+    # setdiff1d keeps customer-file order, so sort explicitly to make the seeded draw
+    # independent of row order
+    unused_business_ids = np.sort(np.setdiff1d(available_business_ids, used_business_ids, assume_unique=True))
+    print(f"Unused business_ids available: {unused_business_ids.size:,}")
     
-    if len(unused_business_ids) == 0:
+    if unused_business_ids.size == 0:
         print("❌ No unused business_ids available for filling")
         return email_df
     
-    # 5. Fill missing business_ids
+    # 5. Fill missing business_ids (in place - the original frame is not needed afterwards)
     print("\n4. Filling missing business_ids...")
-    email_df_filled = email_df.copy()
     
     # Get rows with missing business_id
-    missing_mask = email_df_filled['business_id'].isna()
-    missing_count = missing_mask.sum()
+    missing_count = email_na_count
     
     print(f"Rows with missing business_id: {missing_count:,}")
     
-    if missing_count > len(unused_business_ids):
-        print(f"⚠️ Warning: More missing rows ({missing_count:,}) than available business_ids ({len(unused_business_ids):,})")
+    if missing_count > unused_business_ids.size:
+        print(f"⚠️ Warning: More missing rows ({missing_count:,}) than available business_ids ({unused_business_ids.size:,})")
         print("Will reuse business_ids if necessary")
     
-    # Convert to list for random selection
-    unused_list = list(unused_business_ids)
-    
-    # Set seed for reproducible results
-    np.random.seed(42)
-    random.seed(42)
-    
-    # Fill missing business_ids
-    filled_count = 0
-    for idx in email_df_filled[missing_mask].index:
-        if len(unused_list) > 0:
-            # Select random unused business_id
-            selected_business_id = np.random.choice(unused_list)
-            unused_list.remove(selected_business_id)
-        else:
-            # If no unused business_ids left, reuse from available pool
-            selected_business_id = np.random.choice(list(available_business_ids))
-        
-        email_df_filled.loc[idx, 'business_id'] = selected_business_id
-        filled_count += 1
+    # Draw unused business_ids without replacement in one call (seeded for reproducible results)
+    rng = np.random.default_rng(42)
+    unique_count = min(missing_count, unused_business_ids.size)
+    picked = rng.choice(unused_business_ids, size=unique_count, replace=False)
+    
+    # If unused business_ids run out, reuse from available pool
+    if missing_count > unique_count:
+        reused = rng.choice(available_business_ids, size=missing_count - unique_count, replace=True)
+        picked = np.concatenate([picked, reused])
+    
+    # Fill missing business_ids in a single bulk assignment
+    # (np.place consumes picked in mask order; np.putmask would index it by row position)
+    np.place(business_id_values, missing_mask, picked)
+    email_df['business_id'] = business_id_values
+    filled_count = missing_count
     
     print(f"✅ Filled {filled_count:,} missing business_ids")
     
     # 6. Verify results
     print("\n5. Verifying results...")
-    final_na_count = email_df_filled['business_id'].isna().sum()
-    final_total = len(email_df_filled)
+    final_na_count = int(pd.isna(business_id_values).sum())
+    final_total = email_total
     
     print(f"Final status:")
     print(f"   Total rows: {final_total:,}")
@@ -106,19 +107,19 @@ def fill_missing_business_ids():
     
     # 7. Check business_id distribution
     print("\n6. Checking business_id distribution...")
-    business_id_counts = email_df_filled['business_id'].value_counts()
+    business_id_counts = pd.Series(business_id_values).value_counts()  # sorted descending
     print(f"Business_id distribution:")
-    print(f"   Unique business_ids: {len(business_id_counts)}")
+    print(f"   Unique business_ids: {business_id_counts.size}")
     print(f"   Average emails per business_id: {business_id_counts.mean():.1f}")
-    print(f"   Max emails per business_id: {business_id_counts.max()}")
-    print(f"   Min emails per business_id: {business_id_counts.min()}")
+    print(f"   Max emails per business_id: {business_id_counts.iat[0]}")
+    print(f"   Min emails per business_id: {business_id_counts.iat[-1]}")
     
     # 8. Save results
-    output_filename = 'email_customer_matched_full_filled.csv'
-    email_df_filled.to_csv(output_filename, index=False)
+    output_filename = 'email_customer_matched_full_filled.parquet'
+    email_df.to_parquet(output_filename, index=False, compression='zstd')
     print(f"\n✅ Filled data saved: {output_filename}")
     
-    return email_df_filled
+    return email_df
 
 def main():
     # Execute the filling process
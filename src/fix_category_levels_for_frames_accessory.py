@@ -38,7 +38,7 @@ def fix_category_levels_for_frames_accessory(input_file, output_file):
     """
     
     print(f"데이터 로드 중: {input_file}")
-    df = pd.read_csv(input_file)
+    df = pd.read_parquet(input_file) if input_file.endswith('.parquet') else pd.read_csv(input_file)
     print(f"전체 데이터: {len(df)}행")
     
     # FRAMES와 ACCESSORY 데이터만 필터링
@@ -99,7 +99,7 @@ def fix_category_levels_for_frames_accessory(input_file, output_file):
 
 def main():
     # 파일 경로 설정
-    input_file = "../data/inventory_final_anonymous_updated.csv"
+    input_file = "../data/inventory_final_anonymous_updated.parquet"
     output_file = "../data/inventory_final_anonymous_fixed.csv"
     
     # 수정 실행
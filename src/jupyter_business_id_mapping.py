@@ -2,8 +2,15 @@
 # Copy this code to a new cell and run it
 
 import pandas as pd
+import numpy as np
 import re
 
+# Account number pattern: numeric base followed by an optional alphabetic suffix
+_ACCT_RE = re.compile(r'(\d+)([A-Za-z]*)$')
+
+# Trailing "#number" account tag on customer names
+_NAME_ACCT_SUFFIX_RE = re.compile(r'\s*#\d+[A-Za-z]*$')
+
 def extract_business_info(account_no):
     """
     Extract base business number and account type from account number.
@@ -19,7 +26,7 @@ def extract_business_info(account_no):
     account_str = str(account_no)
     
     # Find alphabetic suffix pattern
-    match = re.match(r'(\d+)([A-Za-z]*)$', account_str)
+    match = _ACCT_RE.match(account_str)
     
     if match:
         base_number = match.group(1)  # Base number (e.g., 1341)
@@ -54,7 +61,7 @@ def clean_customer_name(customer_name):
         return None
     
     # Remove "#number" pattern (e.g., "1001 OPTICAL #1341" -> "1001 OPTICAL")
-    clean_name = re.sub(r'\s*#\d+[A-Za-z]*$', '', str(customer_name))
+    clean_name = _NAME_ACCT_SUFFIX_RE.sub('', str(customer_name))
     return clean_name.strip()
 
 # Add business information to df (skip this part if already processed)
@@ -67,15 +74,17 @@ if 'business_id' not in df.columns:
     )
     
     # Generate unique business ID
-    unique_base_accounts = df['base_account'].dropna().unique()
-    business_id_map = {base: f"BUS_{i+1:04d}" for i, base in enumerate(sorted(unique_base_accounts))}
+    codes, unique_base_accounts = pd.factorize(df['base_account'], sort=True)
+    # Trailing None label maps the -1 code of missing base accounts to None
+    business_id_labels = np.array([f"BUS_{i+1:04d}" for i in range(len(unique_base_accounts))] + [None], dtype=object)
     
     # Add business ID
-    df['business_id'] = df['base_account'].map(business_id_map)
+    df['business_id'] = business_id_labels[codes]
     
     # Additional columns for data analysis
     df['is_main_account'] = df['suffix'] == ''  # Main account flag (lens)
-    df['has_multiple_accounts'] = df.groupby('business_id')['business_id'].transform('count') > 1
+    business_id_counts = df['business_id'].value_counts()
+    df['has_multiple_accounts'] = df['business_id'].map(business_id_counts).to_numpy() > 1
 
 print(f"df unique businesses: {df['business_id'].nunique()}")
 print(f"df original Customer unique values: {df['Customer'].nunique()}")
@@ -88,13 +97,11 @@ print("\n=== Processing df3... ===")
 df3['clean_customer_name'] = df3['Name'].apply(clean_customer_name)
 
 # 2. Create mapping from df's clean customer name and business_id
-customer_business_map = df[['clean_customer_name', 'business_id']].drop_duplicates()
+# (first business_id per clean name; a hash lookup instead of a merge)
+customer_business_map = df.drop_duplicates('clean_customer_name').set_index('clean_customer_name')['business_id']
 
 # 3. Apply mapping
-df3 = df3.merge(customer_business_map, 
-               left_on='clean_customer_name', 
-               right_on='clean_customer_name', 
-               how='left')
+df3['business_id'] = df3['clean_customer_name'].map(customer_business_map)
 
 # Check mapping results
 unmapped_count = df3['business_id'].isna().sum()
@@ -122,21 +129,12 @@ print("\n=== Clean Customer Name Processing Verification ===")
 # df verification
 print("=== df Customer Name Transformation Sample ===")
 sample_df = df[['Customer', 'clean_customer_name', 'Account No.', 'business_id']].head(10)
-for idx, row in sample_df.iterrows():
-    print(f"Original: {row['Customer']}")
-    print(f"Clean name: {row['clean_customer_name']}")
-    print(f"Account number: {row['Account No.']}")
-    print(f"Business ID: {row['business_id']}")
-    print("-" * 50)
+print(sample_df.to_string(index=False))
 
 # df3 verification
 print("\n=== df3 Customer Name Transformation Sample ===")
 sample_df3 = df3[['Name', 'clean_customer_name', 'business_id']].head(10)
-for idx, row in sample_df3.iterrows():
-    print(f"Original: {row['Name']}")
-    print(f"Clean name: {row['clean_customer_name']}")
-    print(f"Business ID: {row['business_id']}")
-    print("-" * 50)
+print(sample_df3.to_string(index=False))
 
 # Mapping success rate
 df3_mapped_records = df3['business_id'].notna().sum()
@@ -169,7 +167,7 @@ business_groups = df.groupby('business_id').agg({
     'account_type': list
 }).head(5)
 
-for idx, row in business_groups.iterrows():
+for idx, row in business_groups.to_dict(orient='index').items():
     print(f"\nBusiness ID: {idx}")
     print(f"Clean customer name: {row['clean_customer_name']}")
     print(f"Original customer names: {row['Customer']}")
@@ -2,8 +2,24 @@
 # Copy this code to a new cell and run it
 
 import pandas as pd
+import numpy as np
 import re
 
+# Precompiled patterns shared by the scalar and column-wise helpers
+_ACCT_RE = re.compile(r'(\d+)([A-Za-z]*)$')
+_HASH_RE = re.compile(r'#\d+')
+_WS_RE = re.compile(r'\s+')
+
+# Account type classification by suffix
+ACCOUNT_TYPE_MAP = {
+    'A': 'Frame',
+    'F': 'Frame', 
+    'K': 'Frame',
+    'S': 'Frame',
+    'E': 'Frame',
+    '': 'Lens'  # No suffix means lens
+}
+
 def clean_customer_name(name):
     """
     Clean customer name by removing patterns and extracting account information
@@ -14,10 +30,10 @@ def clean_customer_name(name):
     name = str(name).strip()
     
     # Remove "#number" pattern (e.g., "1001 OPTICAL #1341" -> "1001 OPTICAL")
-    name = re.sub(r'#\d+', '', name).strip()
+    name = _HASH_RE.sub('', name).strip()
     
     # Remove extra spaces
-    name = re.sub(r'\s+', ' ', name).strip()
+    name = _WS_RE.sub(' ', name).strip()
     
     return name
 
@@ -31,28 +47,44 @@ def extract_account_info(customer_name):
     customer_name = str(customer_name).strip()
     
     # Find alphabetic suffix pattern
-    pattern = r'(\d+)([A-Za-z]*)$'
-    match = re.search(pattern, customer_name)
+    match = _ACCT_RE.search(customer_name)
     
     if match:
         base_number = match.group(1)  # Base number (e.g., 1341)
         suffix = match.group(2).upper() if match.group(2) else ''  # Suffix (e.g., A, F, K, S, E)
         
-        # Account type classification
-        account_type_map = {
-            'A': 'Frame',
-            'F': 'Frame', 
-            'K': 'Frame',
-            'S': 'Frame',
-            'E': 'Frame',
-            '': 'Lens'  # No suffix means lens
-        }
-        
-        account_type = account_type_map.get(suffix, 'Unknown')
+        account_type = ACCOUNT_TYPE_MAP.get(suffix, 'Unknown')
         return base_number, suffix, account_type
     
     return None, None, None
 
+def clean_customer_name_column(names):
+    """
+    Column-wise version of clean_customer_name (returns Arrow-backed strings, nulls as <NA>)
+    """
+    return (names.astype('string[pyarrow]')
+                 .str.replace(_HASH_RE, '', regex=True)
+                 .str.replace(_WS_RE, ' ', regex=True)
+                 .str.strip())
+
+def extract_account_info_columns(account_nos):
+    """
+    Column-wise version of extract_account_info (base_account, suffix, account_type)
+    """
+    extracted = account_nos.astype('string[pyarrow]').str.strip().str.extract(_ACCT_RE)
+    matched = extracted[0].notna() & account_nos.notna()
+    
+    suffix = extracted[1].fillna('').str.upper()
+    account_type = suffix.map(ACCOUNT_TYPE_MAP).fillna('Unknown')
+    
+    result = pd.DataFrame({
+        'base_account': extracted[0],
+        'suffix': suffix,
+        'account_type': account_type
+    }, index=account_nos.index).astype(object)
+    
+    return result.where(matched, None)
+
 # Example usage
 print("=== Customer Name Cleaning Example ===")
 sample_names = [
@@ -77,128 +109,24 @@ for name in sample_names:
 print("=== Processing df... ===")
 
 # 1. Add clean customer name
-df['customer_name_clean'] = df['Customer'].apply(lambda x: str(x).strip() if pd.notna(x) else x)
+df['customer_name_clean'] = clean_customer_name_column(df['Customer'])
 
-# 2. Process account numbers (skip if already processed)
+# 2. Process account numbers (skip if already processed - reruns reuse the existing columns)
 if 'business_id' not in df.columns:
-    df[['base_account', 'suffix', 'account_type']] = df['Account No.'].apply(
-        lambda x: pd.Series(extract_account_info(x))
-    )
-
-# 3. Generate unique business ID
-df['business_id'] = df['base_account'].fillna('unknown')
-
-# 4. Additional columns for data analysis
-df['is_main_account'] = df['suffix'] == ''  # Main account flag (lens)
-df['account_type'] = df['suffix'].map({'A': 'Frame', 'F': 'Frame', 'K': 'Frame', 'S': 'Frame', 'E': 'Frame', '': 'Lens'})
-
-print(f"df unique businesses: {df['business_id'].nunique()}")
-print(f"df original Customer unique values: {df['Customer'].nunique()}")
-print(f"df clean customer name unique values: {df['customer_name_clean'].nunique()}")
-
-# df3 processing
-print("\n=== Processing df3... ===")
-
-# 1. Add clean customer name
-df3['customer_name_clean'] = df3['Name'].apply(lambda x: str(x).strip() if pd.notna(x) else x)
-
-# 2. Create mapping from df's clean customer name and business_id
-customer_business_map = df[['customer_name_clean', 'business_id']].drop_duplicates()
-
-# 3. Apply mapping
-df3 = df3.merge(customer_business_map, 
-               left_on='customer_name_clean', 
-               right_on='customer_name_clean', 
-               how='left')
-
-# Check mapping results
-mapped_count = df3['business_id'].notna().sum()
-total_count = len(df3)
-print(f"df3 mapping results:")
-print(f"   Successfully mapped: {mapped_count:,}/{total_count:,} ({mapped_count/total_count*100:.1f}%)")
-
-# Check unmapped customer names
-unmapped_count = df3['business_id'].isna().sum()
-if unmapped_count > 0:
-    unmapped_customers = df3[df3['business_id'].isna()]['customer_name_clean'].unique()
-    print(f"\nUnmapped customer names (top 10):")
-    for customer in unmapped_customers[:10]:
-        print(f"  - {customer}")
-
-# Verification
-print("\n=== df Verification ===")
-print(f"Original Customer column unique values: {df['Customer'].nunique()}")
-print(f"Clean customer name unique values: {df['customer_name_clean'].nunique()}")
-
-# Sample comparison
-print("\n=== df Customer Name Transformation Sample ===")
-sample_df = df[['Customer', 'customer_name_clean', 'Account No.', 'business_id']].head(10)
-for idx, row in sample_df.iterrows():
-    print(f"Original: {row['Customer']}")
-    print(f"Clean name: {row['customer_name_clean']}")
-    print(f"Account number: {row['Account No.']}")
-    print(f"Business ID: {row['business_id']}")
-    print("-" * 50)
-
-print("\n=== df3 Verification ===")
-print(f"Original Name column unique values: {df3['Name'].nunique()}")
-print(f"Clean customer name unique values: {df3['customer_name_clean'].nunique()}")
-
-# Sample comparison
-print("\n=== df3 Customer Name Transformation Sample ===")
-sample_df3 = df3[['Name', 'customer_name_clean', 'business_id']].head(10)
-for idx, row in sample_df3.iterrows():
-    print(f"Original: {row['Name']}")
-    print(f"Clean name: {row['customer_name_clean']}")
-    print(f"Business ID: {row['business_id']}")
-    print("-" * 50)
-
-# Final summary
-print("\n=== Final Summary ===")
-print(f"df unique businesses: {df['business_id'].nunique()}")
-print(f"df3 mapped unique businesses: {df3['business_id'].dropna().nunique()}")
-print(f"df clean customer name unique values: {df['customer_name_clean'].nunique()}")
-print(f"df3 clean customer name unique values: {df3['customer_name_clean'].nunique()}")
-
-# Multiple accounts for same business example
-print("\n=== Multiple Accounts for Same Business Example ===")
-business_groups = df.groupby('business_id').agg({
-    'customer_name_clean': 'first',
-    'Customer': list,
-    'Account No.': list,
-    'suffix': list
-}).head(5)
-
-for idx, row in business_groups.iterrows():
-    print(f"\nBusiness ID: {idx}")
-    print(f"Clean customer name: {row['customer_name_clean']}")
-    print(f"Original customer names: {row['Customer']}")
-    print(f"Accounts: {row['Account No.']}")
-    print(f"Suffixes: {row['suffix']}")
-    print("-" * 50)
-
-# df processing
-print("=== Processing df... ===")
-
-# 1. Add clean customer name
-df['customer_name_clean'] = df['Customer'].apply(clean_customer_name)
-
-# 2. Process account numbers (skip if already processed)
-if 'business_id' not in df.columns:
-    df[['base_account', 'suffix', 'account_type']] = df['Account No.'].apply(
-        lambda x: pd.Series(extract_account_info(x))
-    )
+    df[['base_account', 'suffix', 'account_type']] = extract_account_info_columns(df['Account No.'])
 
     # 3. Generate unique business ID
-    unique_base_accounts = df['base_account'].dropna().unique()
-    business_id_map = {base: f"BUS_{i+1:04d}" for i, base in enumerate(sorted(unique_base_accounts))}
+    codes, unique_base_accounts = pd.factorize(df['base_account'], sort=True)
+    # Trailing None label maps the -1 code of missing base accounts to None
+    business_id_labels = np.array([f"BUS_{i+1:04d}" for i in range(len(unique_base_accounts))] + [None], dtype=object)
 
     # 4. Add business ID
-    df['business_id'] = df['base_account'].map(business_id_map)
+    df['business_id'] = business_id_labels[codes]
 
     # 5. Additional columns for data analysis
     df['is_main_account'] = df['suffix'] == ''  # Main account flag (lens)
-    df['has_multiple_accounts'] = df.groupby('business_id')['business_id'].transform('count') > 1
+    business_id_counts = df['business_id'].value_counts()
+    df['has_multiple_accounts'] = df['business_id'].map(business_id_counts).to_numpy() > 1
 
 print(f"df unique businesses: {df['business_id'].nunique()}")
 print(f"df original Customer unique values: {df['Customer'].nunique()}")
@@ -208,33 +136,33 @@ print(f"df clean customer name unique values: {df['customer_name_clean'].nunique
 print("\n=== Processing df3... ===")
 
 # 1. Add clean customer name
-df3['customer_name_clean'] = df3['Name'].apply(clean_customer_name)
+df3['customer_name_clean'] = clean_customer_name_column(df3['Name'])
 
 # 2. Create mapping from df's clean customer name and business_id
-customer_business_map = df[['customer_name_clean', 'business_id']].drop_duplicates()
+# (first business_id per clean name; a hash lookup instead of a merge)
+customer_business_map = df.drop_duplicates('customer_name_clean').set_index('customer_name_clean')['business_id']
 
 # 3. Apply mapping
-df3 = df3.merge(customer_business_map, 
-               left_on='customer_name_clean', 
-               right_on='customer_name_clean', 
-               how='left')
+df3['business_id'] = df3['customer_name_clean'].map(customer_business_map)
 
 # Check mapping results
-unmapped_count = df3['business_id'].isna().sum()
+unmapped_mask = df3['business_id'].isna()
+unmapped_count = unmapped_mask.sum()
 total_count = len(df3)
+success_rate = (total_count - unmapped_count) / total_count * 100
 
 print(f"=== df3 Mapping Results ===")
 print(f"Total records: {total_count}")
 print(f"Mapped records: {total_count - unmapped_count}")
 print(f"Unmapped records: {unmapped_count}")
-print(f"Mapping success rate: {((total_count - unmapped_count) / total_count * 100):.2f}%")
+print(f"Mapping success rate: {success_rate:.2f}%")
 
 print(f"df3 original Name unique values: {df3['Name'].nunique()}")
 print(f"df3 clean customer name unique values: {df3['customer_name_clean'].nunique()}")
 
 # Check unmapped customer names
 if unmapped_count > 0:
-    unmapped_customers = df3[df3['business_id'].isna()]['customer_name_clean'].unique()
+    unmapped_customers = df3.loc[unmapped_mask, 'customer_name_clean'].unique()
     print(f"\nUnmapped customer names (top 10):")
     for customer in unmapped_customers[:10]:
         print(f"  - {customer}")
@@ -245,26 +173,12 @@ print("\n=== Clean Customer Name Processing Verification ===")
 # df verification
 print("=== df Customer Name Transformation Sample ===")
 sample_df = df[['Customer', 'customer_name_clean', 'Account No.', 'business_id']].head(10)
-for idx, row in sample_df.iterrows():
-    print(f"Original: {row['Customer']}")
-    print(f"Clean name: {row['customer_name_clean']}")
-    print(f"Account number: {row['Account No.']}")
-    print(f"Business ID: {row['business_id']}")
-    print("-" * 50)
+print(sample_df.to_string(index=False))
 
 # df3 verification
 print("\n=== df3 Customer Name Transformation Sample ===")
 sample_df3 = df3[['Name', 'customer_name_clean', 'business_id']].head(10)
-for idx, row in sample_df3.iterrows():
-    print(f"Original: {row['Name']}")
-    print(f"Clean name: {row['customer_name_clean']}")
-    print(f"Business ID: {row['business_id']}")
-    print("-" * 50)
-
-# Mapping success rate
-df3_mapped_records = df3['business_id'].notna().sum()
-df3_total_records = len(df3)
-success_rate = (df3_mapped_records / df3_total_records) * 100
+print(sample_df3.to_string(index=False))
 
 print(f"\n=== Final Mapping Success Rate ===")
 print(f"df3 mapping success rate: {success_rate:.2f}%")
@@ -289,15 +203,18 @@ business_groups = df.groupby('business_id').agg({
     'customer_name_clean': 'first',
     'Customer': list,
     'Account No.': list,
+    'suffix': list,
     'account_type': list
 }).head(5)
 
-for idx, row in business_groups.iterrows():
+for idx, row in business_groups.to_dict(orient='index').items():
     print(f"\nBusiness ID: {idx}")
     print(f"Clean customer name: {row['customer_name_clean']}")
     print(f"Original customer names: {row['Customer']}")
     print(f"Accounts: {row['Account No.']}")
+    print(f"Suffixes: {row['suffix']}")
     print(f"Account types: {row['account_type']}")
+    print("-" * 50)
 
 # Processed data preview
 print("\n=== df Processed Data Preview ===")
@@ -313,4 +230,4 @@ print("\n=== df3 Business Record Count Distribution (Top 10) ===")
 business_record_counts = df3.groupby('business_id').size().sort_values(ascending=False).head(10)
 for business_id, count in business_record_counts.items():
     customer_name = df3[df3['business_id'] == business_id]['customer_name_clean'].iloc[0]
-    print(f"{business_id} ({customer_name}): {count} records") 
\ No newline at end of file
+    print(f"{business_id} ({customer_name}): {count} records")
@@ -38,7 +38,7 @@ def merge_inventory_with_lens_update():
     # 2. Load new lens data
     print("\nLoading new lens data...")
     try:
-        new_lens_df = pd.read_csv('data/lens_data_updated.csv')
+        new_lens_df = pd.read_parquet('data/lens_data_updated.parquet')
         print(f"New lens data: {len(new_lens_df)} rows")
     except Exception as e:
         print(f"New lens data load failed: {e}")
@@ -14,23 +14,33 @@ import sys
 import json
 import time
 import logging
+import threading
 import traceback
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from contextlib import contextmanager
+import orjson
 import psutil
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; older interpreters get a regular dataclass
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class MetricData:
     """
     Structured metric data container
     
     What: Standardized metric storage format
     Why: Consistent metric tracking across pipeline components
-    How: Dataclass with serialization support
+    How: Slotted dataclass (no per-instance __dict__) with serialization support
     Alternative: Dictionary (less type safety)
     """
     timestamp: datetime
@@ -39,6 +49,39 @@ class MetricData:
     value: float
     unit: str
     metadata: Dict[str, Any] = None
+    failed: bool = False
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler with a large write buffer
+    
+    What: FileHandler that only flushes to disk on WARNING+ records
+    Why: logging.FileHandler flushes after every record - one write() per log line
+    How: 1 MiB buffered file object; lower-level records stay buffered until a
+         WARNING+ record, close(), or logging's own atexit shutdown flushes them
+    Alternative: QueueHandler + listener thread (more moving parts)
+    """
+    
+    def __init__(self, filename, mode: str = 'a', encoding: Optional[str] = None,
+                 delay: bool = False, buffer_size: int = 1 << 20,
+                 flush_level: int = logging.WARNING):
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        super().__init__(filename, mode, encoding, delay)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding)
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except Exception:
+            self.handleError(record)
 
 class PipelineMonitor:
     """
@@ -62,8 +105,25 @@ class PipelineMonitor:
         self.log_dir = Path(log_dir)
         self.metrics_dir = Path(metrics_dir)
         self.start_time = datetime.now()
-        self.metrics_buffer = []
+        # Raw (timestamp_ns, component, metric_type, value, unit, metadata, failed) tuples;
+        # bounded so a failing flush cannot grow memory without limit (the cap decides what is lost)
+        self.metrics_buffer = deque(maxlen=10_000)
+        self._flush_threshold = 1000
+        self._flush_interval = 60.0
+        # Consecutive failed writes before a batch is dropped instead of re-queued
+        self._max_flush_retries = 3
+        self._flush_failures = 0
+        self._flush_requested = threading.Event()
+        self._stop_flush = threading.Event()
+        # Metric files/directories written since the last fsync (synced on shutdown)
+        self._unsynced_paths = set()
         self.performance_data = {}
+        self._today_str = ""
+        self._today_expires = 0.0
+        self._health_cache = (0.0, None)
+        self._health_ttl = 5.0
+        self._disk_cache = (0.0, None)
+        self._disk_ttl = 60.0
         
         # Create directories
         self.log_dir.mkdir(exist_ok=True)
@@ -75,8 +135,31 @@ class PipelineMonitor:
         # Initialize system monitoring
         self._initialize_system_monitoring()
         
+        # Background metrics flusher
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop, name="metrics-flush", daemon=True
+        )
+        self._flush_thread.start()
+        
         self.logger.info("Pipeline monitoring system initialized")
     
+    def _today(self) -> str:
+        """
+        Current local date as YYYYMMDD
+        
+        What: Memoized date string used in log and metric filenames
+        Why: Avoid a datetime.now() + strftime() on every metrics flush
+        How: Cache the string until the next local midnight
+        Alternative: Epoch-day check on time.time() // 86400 (UTC, not local date)
+        """
+        now = time.time()
+        if now >= self._today_expires:
+            today = datetime.fromtimestamp(now)
+            self._today_str = today.strftime("%Y%m%d")
+            next_midnight = datetime.combine(today.date() + timedelta(days=1), datetime.min.time())
+            self._today_expires = next_midnight.timestamp()
+        return self._today_str
+    
     def _setup_logging(self) -> None:
         """
         Configure comprehensive logging system
@@ -99,8 +182,8 @@ class PipelineMonitor:
         self.logger.setLevel(logging.DEBUG)
         
         # File handler for detailed logs
-        file_handler = logging.FileHandler(
-            self.log_dir / f'pipeline_{datetime.now().strftime("%Y%m%d")}.log'
+        file_handler = BufferedFileHandler(
+            self.log_dir / f'pipeline_{self._today()}.log'
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(detailed_formatter)
@@ -111,8 +194,8 @@ class PipelineMonitor:
         console_handler.setFormatter(simple_formatter)
         
         # Error file handler
-        error_handler = logging.FileHandler(
-            self.log_dir / f'errors_{datetime.now().strftime("%Y%m%d")}.log'
+        error_handler = BufferedFileHandler(
+            self.log_dir / f'errors_{self._today()}.log'
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(detailed_formatter)
@@ -132,6 +215,8 @@ class PipelineMonitor:
         Alternative: OS-specific tools (less portable)
         """
         try:
+            # Reused by monitor_operation for every memory sample
+            self._proc = psutil.Process(os.getpid())
             self.system_info = {
                 'cpu_count': psutil.cpu_count(),
                 'memory_total': psutil.virtual_memory().total,
@@ -139,9 +224,12 @@ class PipelineMonitor:
                 'python_version': sys.version,
                 'platform': sys.platform
             }
+            # Prime the CPU counter so later non-blocking cpu_percent() calls have a baseline
+            psutil.cpu_percent(interval=None)
             self.logger.info(f"System monitoring initialized: {self.system_info}")
         except Exception as e:
             self.logger.error(f"Failed to initialize system monitoring: {e}")
+            self._proc = None
             self.system_info = {}
     
     def record_metric(self, component: str, metric_type: str, value: float, 
@@ -151,23 +239,32 @@ class PipelineMonitor:
         
         What: Store metric data with timestamp and context
         Why: Track performance trends and identify bottlenecks
-        How: Structured metric storage with buffering
+        How: Plain tuples in a deque; serialized to MetricData fields on flush
         Alternative: Real-time database (more complex, higher overhead)
         """
-        metric = MetricData(
-            timestamp=datetime.now(),
-            component=component,
-            metric_type=metric_type,
-            value=value,
-            unit=unit,
-            metadata=metadata or {}
+        failed = metadata is not None and metadata.get('status') == 'failed'
+        self.metrics_buffer.append(
+            (time.time_ns(), component, metric_type, value, unit, metadata, failed)
         )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Metric recorded: %s.%s = %s %s", component, metric_type, value, unit)
         
-        self.metrics_buffer.append(metric)
-        self.logger.debug(f"Metric recorded: {component}.{metric_type} = {value} {unit}")
+        # Wake the background flusher if the buffer gets large
+        if len(self.metrics_buffer) >= self._flush_threshold:
+            self._flush_requested.set()
+    
+    def _flush_loop(self) -> None:
+        """
+        Background metrics flush loop
         
-        # Flush buffer if it gets too large
-        if len(self.metrics_buffer) > 1000:
+        What: Flush buffered metrics every few seconds or when the buffer fills up
+        Why: Keep file I/O off the record_metric caller's thread
+        How: Daemon thread waiting on an Event with a timeout
+        Alternative: Flush inline in record_metric (latency spikes for the caller)
+        """
+        while not self._stop_flush.is_set():
+            self._flush_requested.wait(self._flush_interval)
+            self._flush_requested.clear()
             self._flush_metrics()
     
     def _flush_metrics(self) -> None:
@@ -176,38 +273,131 @@ class PipelineMonitor:
         
         What: Save buffered metrics to persistent storage
         Why: Prevent memory overflow and ensure data persistence
-        How: JSON serialization to dated files
+        How: One zstd Parquet part file per flush under a metrics/date=YYYYMMDD/ directory
         Alternative: Database storage (more complex setup)
         """
         if not self.metrics_buffer:
             return
         
+        # Drain with popleft so metrics recorded concurrently stay in the buffer
+        buffer = self.metrics_buffer
+        batch = [buffer.popleft() for _ in range(len(buffer))]
+        
         try:
-            metrics_file = self.metrics_dir / f'metrics_{datetime.now().strftime("%Y%m%d")}.json'
-            
-            # Convert metrics to serializable format
-            metrics_data = []
-            for metric in self.metrics_buffer:
-                metric_dict = asdict(metric)
-                metric_dict['timestamp'] = metric.timestamp.isoformat()
-                metrics_data.append(metric_dict)
-            
-            # Append to existing file or create new
-            existing_data = []
-            if metrics_file.exists():
-                with open(metrics_file, 'r') as f:
-                    existing_data = json.load(f)
+            table = self._metrics_table(batch)
+        except Exception as e:
+            # A bad record would fail every retry - find it per row and drop only that
+            good = []
+            for row in batch:
+                try:
+                    self._metrics_table([row])
+                    good.append(row)
+                except Exception:
+                    pass
+            self.logger.error(f"Dropped {len(batch) - len(good)} unserializable metrics: {e}")
+            try:
+                table = self._metrics_table(good) if good else None
+            except Exception as e2:
+                self.logger.error(f"Dropped {len(good)} metrics that could not be combined: {e2}")
+                table = None
+            if table is None:
+                return
+            batch = good
+        
+        try:
+            day_dir = self.metrics_dir / f'date={self._today()}'
+            day_dir.mkdir(exist_ok=True)
             
-            existing_data.extend(metrics_data)
+            # Encode in memory and hand the whole file to the OS in one os.write;
+            # written under a temporary name so readers never see a partial file
+            sink = pa.BufferOutputStream()
+            pq.write_table(table, sink, compression='zstd')
+            payload = memoryview(sink.getvalue())
             
-            with open(metrics_file, 'w') as f:
-                json.dump(existing_data, f, indent=2)
+            metrics_file = day_dir / f'part-{batch[0][0]}.parquet'
+            tmp_file = metrics_file.with_suffix('.parquet.tmp')
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+                         | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0), 0o644)
+            try:
+                while payload:
+                    payload = payload[os.write(fd, payload):]
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, metrics_file)
+            self._unsynced_paths.update((metrics_file, day_dir))
+            self._flush_failures = 0
             
-            self.logger.info(f"Flushed {len(self.metrics_buffer)} metrics to {metrics_file}")
-            self.metrics_buffer.clear()
+            self.logger.info(f"Flushed {len(batch)} metrics to {metrics_file}")
             
         except Exception as e:
-            self.logger.error(f"Failed to flush metrics: {e}")
+            self._flush_failures += 1
+            if self._flush_failures > self._max_flush_retries:
+                self._flush_failures = 0
+                self.logger.error(f"Failed to flush metrics, dropped {len(batch)} after "
+                                  f"{self._max_flush_retries} retries: {e}")
+                return
+            # Put the batch back for the next flush, only into free space so newer
+            # metrics are never pushed out; the oldest of the batch go first
+            room = buffer.maxlen - len(buffer)
+            requeue = batch[max(0, len(batch) - room):]
+            buffer.extendleft(reversed(requeue))
+            self.logger.error(f"Failed to flush metrics ({len(requeue)} re-queued, "
+                              f"{len(batch) - len(requeue)} dropped): {e}")
+    
+    def _metrics_table(self, batch: List[tuple]) -> pa.Table:
+        """
+        Build the Arrow table for a batch of buffered metrics
+        
+        What: Convert raw metric tuples into a typed Arrow table
+        Why: Shared by the normal flush and the per-row check that isolates bad records
+        How: Vectorized local-time conversion plus one typed Arrow array per column
+        Alternative: pandas DataFrame (extra copy and object dtype inference)
+        """
+        # Convert all timestamps to naive local time in one vectorized pass
+        timestamps_ns = np.fromiter((row[0] for row in batch), dtype=np.int64, count=len(batch))
+        utc_offset = time.localtime(timestamps_ns[0] // 10**9).tm_gmtoff
+        if utc_offset == time.localtime(timestamps_ns[-1] // 10**9).tm_gmtoff:
+            timestamps = (timestamps_ns + utc_offset * 10**9).astype('datetime64[ns]').astype('datetime64[us]')
+        else:
+            # UTC offset changed inside the batch (DST switch) - convert per row
+            timestamps = [datetime.fromtimestamp(ns / 1e9) for ns in timestamps_ns.tolist()]
+        
+        _, components, metric_types, values, units, metadatas, failed = zip(*batch)
+        return pa.table({
+            'timestamp': pa.array(timestamps, type=pa.timestamp('us')),
+            'component': pa.array(components, type=pa.string()),
+            'metric_type': pa.array(metric_types, type=pa.string()),
+            'value': np.asarray(values, dtype=np.float64),
+            'unit': pa.array(units, type=pa.string()),
+            # Free-form metadata is kept as a JSON string column; numpy scalars/arrays
+            # serialize natively and anything else orjson rejects falls back to str()
+            'metadata': pa.array([orjson.dumps(m or {}, option=orjson.OPT_SERIALIZE_NUMPY, default=str).decode()
+                                  for m in metadatas], type=pa.string()),
+            'failed': pa.array(failed, type=pa.bool_())
+        })
+    
+    def _sync_metrics(self) -> None:
+        """
+        fsync metric files written this session
+        
+        What: Force written metric files and their directory entries to disk
+        Why: Durability at shutdown without paying an fsync on every flush
+        How: os.fsync on each written file, then on its day directory (POSIX only)
+        Alternative: fsync per flush (safer against power loss, much slower)
+        """
+        paths, self._unsynced_paths = self._unsynced_paths, set()
+        # Files before directories so the renamed entries are persisted last
+        for path in sorted(paths, key=lambda p: p.is_dir()):
+            if path.is_dir() and os.name == 'nt':
+                continue
+            try:
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            except OSError as e:
+                self.logger.error(f"Failed to fsync {path}: {e}")
     
     @contextmanager
     def monitor_operation(self, operation_name: str, component: str = "pipeline"):
@@ -225,7 +415,7 @@ class PipelineMonitor:
                 process_data()
         """
         start_time = time.time()
-        start_memory = psutil.Process().memory_info().rss if 'psutil' in sys.modules else 0
+        start_memory = self._proc.memory_info().rss if self._proc else 0
         
         self.logger.info(f"Starting operation: {operation_name}")
         
@@ -234,7 +424,7 @@ class PipelineMonitor:
             
             # Record successful completion
             duration = time.time() - start_time
-            end_memory = psutil.Process().memory_info().rss if 'psutil' in sys.modules else 0
+            end_memory = self._proc.memory_info().rss if self._proc else 0
             memory_delta = end_memory - start_memory
             
             self.record_metric(component, "operation_duration", duration, "seconds", {
@@ -308,9 +498,15 @@ class PipelineMonitor:
         
         What: Assess system resource usage and availability
         Why: Proactive monitoring and early warning system
-        How: Resource thresholds and availability checks
+        How: Resource thresholds and availability checks; result cached for
+             self._health_ttl seconds so frequent pollers share one sample
         Alternative: External monitoring tools (more complex)
         """
+        now = time.monotonic()
+        cached_at, cached_status = self._health_cache
+        if cached_status is not None and now - cached_at < self._health_ttl:
+            return cached_status
+        
         health_status = {
             "timestamp": datetime.now().isoformat(),
             "status": "healthy",
@@ -318,8 +514,8 @@ class PipelineMonitor:
         }
         
         try:
-            # Check CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # Check CPU usage (non-blocking: utilization since the previous call)
+            cpu_percent = psutil.cpu_percent(interval=None)
             if cpu_percent > 80:
                 health_status["issues"].append(f"High CPU usage: {cpu_percent}%")
                 health_status["status"] = "warning"
@@ -330,18 +526,14 @@ class PipelineMonitor:
                 health_status["issues"].append(f"High memory usage: {memory.percent}%")
                 health_status["status"] = "warning"
             
-            # Check disk usage
-            disk = psutil.disk_usage('/' if os.name != 'nt' else 'C:')
-            disk_percent = (disk.used / disk.total) * 100
+            # Check disk usage and log file sizes (cached; these change slowly)
+            disk_percent, large_logs = self._disk_and_log_status()
             if disk_percent > 90:
                 health_status["issues"].append(f"High disk usage: {disk_percent:.1f}%")
                 health_status["status"] = "critical"
             
-            # Check log file sizes
-            log_files = list(self.log_dir.glob("*.log"))
-            large_logs = [f for f in log_files if f.stat().st_size > 100 * 1024 * 1024]  # 100MB
             if large_logs:
-                health_status["issues"].append(f"Large log files: {[f.name for f in large_logs]}")
+                health_status["issues"].append(f"Large log files: {large_logs}")
             
             # Record health metrics
             self.record_metric("system", "cpu_percent", cpu_percent, "%")
@@ -353,8 +545,36 @@ class PipelineMonitor:
             health_status["issues"].append(f"Health check failed: {e}")
             self.logger.error(f"Health check error: {e}")
         
+        self._health_cache = (now, health_status)
         return health_status
     
+    def _disk_and_log_status(self) -> tuple:
+        """
+        Disk usage percentage and oversized log files
+        
+        What: (disk_percent, names of *.log files over 100MB) for the health check
+        Why: Avoid a disk_usage call and a stat per log file on every health check
+        How: os.scandir over log_dir, result cached for self._disk_ttl seconds
+        Alternative: Path.glob + stat (extra syscalls per file)
+        """
+        now = time.monotonic()
+        cached_at, cached_status = self._disk_cache
+        if cached_status is not None and now - cached_at < self._disk_ttl:
+            return cached_status
+        
+        disk = psutil.disk_usage('/' if os.name != 'nt' else 'C:')
+        disk_percent = (disk.used / disk.total) * 100
+        
+        with os.scandir(self.log_dir) as entries:
+            large_logs = [
+                entry.name for entry in entries
+                if entry.name.endswith('.log') and entry.is_file()
+                and entry.stat().st_size > 100 * 1024 * 1024  # 100MB
+            ]
+        
+        self._disk_cache = (now, (disk_percent, large_logs))
+        return disk_percent, large_logs
+    
     def generate_performance_report(self, hours: int = 24) -> Dict[str, Any]:
         """
         Generate performance report
@@ -382,17 +602,26 @@ class PipelineMonitor:
             }
             
             # Component-wise analysis
-            df = pd.DataFrame([asdict(m) for m in recent_metrics])
+            df = pd.DataFrame.from_records(
+                ((m.timestamp, m.component, m.metric_type, m.value, m.unit, m.metadata, m.failed)
+                 for m in recent_metrics),
+                columns=['timestamp', 'component', 'metric_type', 'value', 'unit', 'metadata', 'failed']
+            )
+            
+            # One hashed pass per aggregation instead of boolean masks per component
+            component_groups = df.groupby('component', sort=False)
+            value_stats = df.groupby(['component', 'metric_type'], sort=False)['value'].agg(['mean', 'sum'])
+            type_means = value_stats['mean'].unstack('metric_type')
+            type_sums = value_stats['sum'].unstack('metric_type')
             
-            for component in df['component'].unique():
-                component_data = df[df['component'] == component]
-                
-                report["components"][component] = {
-                    "total_operations": len(component_data),
-                    "avg_duration": component_data[component_data['metric_type'] == 'operation_duration']['value'].mean(),
-                    "total_memory_used": component_data[component_data['metric_type'] == 'memory_usage']['value'].sum(),
-                    "error_rate": len(component_data[component_data['metadata'].str.contains('failed', na=False)]) / len(component_data)
-                }
+            component_stats = pd.DataFrame({
+                "total_operations": component_groups.size(),
+                "avg_duration": type_means.get('operation_duration', np.nan),
+                "total_memory_used": type_sums.get('memory_usage', 0.0),
+                "error_rate": component_groups['failed'].mean()
+            })
+            component_stats["total_memory_used"] = component_stats["total_memory_used"].fillna(0.0)
+            report["components"] = component_stats.to_dict(orient='index')
             
             # Generate recommendations
             self._generate_recommendations(report)
@@ -408,23 +637,28 @@ class PipelineMonitor:
         metrics = []
         
         try:
-            # Check recent metric files
-            for metrics_file in self.metrics_dir.glob("metrics_*.json"):
-                with open(metrics_file, 'r') as f:
-                    file_metrics = json.load(f)
-                
-                for metric_data in file_metrics:
-                    metric_time = datetime.fromisoformat(metric_data['timestamp'])
-                    if metric_time >= cutoff_time:
-                        metric = MetricData(
-                            timestamp=metric_time,
-                            component=metric_data['component'],
-                            metric_type=metric_data['metric_type'],
-                            value=metric_data['value'],
-                            unit=metric_data['unit'],
-                            metadata=metric_data.get('metadata', {})
-                        )
-                        metrics.append(metric)
+            # Day directories older than the cutoff day cannot contain recent metrics
+            cutoff_day = cutoff_time.strftime("%Y%m%d")
+            metric_files = [
+                str(f)
+                for day_dir in self.metrics_dir.glob("date=*")
+                if day_dir.name[len("date="):] >= cutoff_day
+                for f in day_dir.glob("part-*.parquet")
+            ]
+            if not metric_files:
+                return metrics
+            
+            # Timestamp filter is pushed down to Parquet row-group statistics
+            table = ds.dataset(metric_files, format='parquet').to_table(
+                filter=ds.field('timestamp') >= pa.scalar(cutoff_time, type=pa.timestamp('us'))
+            )
+            columns = table.to_pydict()
+            for timestamp, component, metric_type, value, unit, metadata, failed in zip(
+                columns['timestamp'], columns['component'], columns['metric_type'],
+                columns['value'], columns['unit'], columns['metadata'], columns['failed']
+            ):
+                metrics.append(MetricData(timestamp, component, metric_type, value, unit,
+                                          orjson.loads(metadata), failed))
         
         except Exception as e:
             self.logger.error(f"Failed to load recent metrics: {e}")
@@ -464,11 +698,18 @@ class PipelineMonitor:
                 log_file.unlink()
                 self.logger.info(f"Deleted old log file: {log_file}")
         
-        # Clean metric files
-        for metric_file in self.metrics_dir.glob("metrics_*.json"):
+        # Clean metric files (Parquet parts and legacy JSON/JSONL files)
+        metric_files = list(self.metrics_dir.glob("date=*/part-*.parquet"))
+        metric_files.extend(self.metrics_dir.glob("metrics_*.json*"))
+        for metric_file in metric_files:
             if datetime.fromtimestamp(metric_file.stat().st_mtime) < cutoff_date:
                 metric_file.unlink()
                 self.logger.info(f"Deleted old metric file: {metric_file}")
+        
+        # Remove day directories left empty
+        for day_dir in self.metrics_dir.glob("date=*"):
+            if day_dir.is_dir() and not any(day_dir.iterdir()):
+                day_dir.rmdir()
     
     def shutdown(self) -> None:
         """
@@ -481,15 +722,20 @@ class PipelineMonitor:
         """
         self.logger.info("Shutting down monitoring system...")
         
-        # Flush remaining metrics
+        # Stop the background flusher, then flush remaining metrics
+        self._stop_flush.set()
+        self._flush_requested.set()
+        self._flush_thread.join()
         self._flush_metrics()
+        self._sync_metrics()
         
         # Log session summary
         session_duration = datetime.now() - self.start_time
         self.logger.info(f"Monitoring session completed. Duration: {session_duration}")
         
-        # Close logging handlers
+        # Flush buffered log output, then close logging handlers
         for handler in self.logger.handlers:
+            handler.flush()
             handler.close()
 
 # Global monitor instance
@@ -1,6 +1,8 @@
 import pandas as pd
+import numpy as np
 import json
 import datetime
+import pyarrow as pa
 
 # Load zoho_emails.json file as pandas DataFrame
 print("Reading JSON file...")
@@ -12,20 +14,26 @@ with open('zoho_emails.json', 'r', encoding='utf-8') as file:
 # Convert JSON data to DataFrame
 email_df = pd.json_normalize(email_data)
 
+# Release the parsed dicts - the DataFrame now holds the columnar copy
+del email_data
+
 print(f"Original data: {email_df.shape}")
 
 # Split sentDateInGMT into date and time
 print("\n=== Starting date and time separation ===")
 
-# Convert millisecond timestamp to date
-email_df['sentDate'] = pd.to_datetime(email_df['sentDateInGMT'].astype(float), unit='ms')
+# Convert millisecond timestamp to date (integer ms; missing values become NaT)
+sent_ms_series = pd.to_numeric(email_df['sentDateInGMT'], errors='coerce').astype('Int64')
+email_df['sentDate'] = pd.to_datetime(sent_ms_series, unit='ms')
 
 # Split date and time
 email_df['sent_date'] = email_df['sentDate'].dt.date
 email_df['sent_time'] = email_df['sentDate'].dt.time
 
 # Split receivedTime in the same way
-email_df['receivedDate'] = pd.to_datetime(email_df['receivedTime'].astype(float), unit='ms')
+email_df['receivedDate'] = pd.to_datetime(
+    pd.to_numeric(email_df['receivedTime'], errors='coerce').astype('Int64'), unit='ms'
+)
 email_df['received_date'] = email_df['receivedDate'].dt.date
 email_df['received_time'] = email_df['receivedDate'].dt.time
 
@@ -45,7 +53,9 @@ print(email_df[['receivedTime', 'received_date', 'received_time']].head())
 
 # Check email count by date
 print("\n=== Email count by date ===")
-daily_emails = email_df.groupby('sent_date').size()
+# Group on the datetime64 day instead of the Python date objects in 'sent_date'
+daily_emails = email_df.groupby(email_df['sentDate'].dt.normalize()).size()
+daily_emails.index = pd.Index(daily_emails.index.date, name='sent_date')
 print(f"Total number of dates: {len(daily_emails)}")
 print(f"Average daily emails: {daily_emails.mean():.1f}")
 print(f"Maximum daily emails: {daily_emails.max()}")
@@ -54,9 +64,17 @@ print("\n=== Email count for last 10 days ===")
 recent_emails = daily_emails.sort_index(ascending=False).head(10)
 print(recent_emails)
 
+# Hour/weekday/month/year histograms are binned from the raw epoch-ms array
+# with NumPy in one pass each instead of a pandas groupby (rows without a
+# sent timestamp are left out, as the groupby did)
+sent_ms = sent_ms_series.dropna().to_numpy(dtype='int64')
+MS_PER_HOUR = 3_600_000
+MS_PER_DAY = 86_400_000
+
 # Check email count by hour
 print("\n=== Email count by hour ===")
-hourly_emails = email_df.groupby(email_df['sent_time'].apply(lambda x: x.hour)).size()
+hourly_emails = pd.Series(np.bincount((sent_ms // MS_PER_HOUR) % 24, minlength=24))
+hourly_emails = hourly_emails[hourly_emails > 0]
 print("Email count by hour (0-23):")
 print(hourly_emails)
 
@@ -66,24 +84,43 @@ print(f"\nHour with most emails: {most_active_hour} ({hourly_emails.max()} email
 
 # Check email count by weekday
 print("\n=== Email count by weekday ===")
-weekday_emails = email_df.groupby(email_df['sentDate'].dt.day_name()).size()
+# 1970-01-01 was a Thursday, so Monday=0 is (days since epoch + 3) % 7
+weekday_counts = np.bincount((sent_ms // MS_PER_DAY + 3) % 7, minlength=7)
+weekday_emails = pd.Series(weekday_counts, index=['Monday', 'Tuesday', 'Wednesday', 'Thursday',
+                                                  'Friday', 'Saturday', 'Sunday'])
+weekday_emails = weekday_emails[weekday_emails > 0]
 print(weekday_emails)
 
 # Check email count by month
 print("\n=== Email count by month ===")
-monthly_emails = email_df.groupby(email_df['sentDate'].dt.to_period('M')).size()
+sent_months, month_counts = np.unique(sent_ms.astype('datetime64[ms]').astype('datetime64[M]'),
+                                      return_counts=True)
+monthly_emails = pd.Series(month_counts, index=pd.DatetimeIndex(sent_months).to_period('M'))
 print("Last 12 months:")
 print(monthly_emails.tail(12))
 
 # Check email count by year
 print("\n=== Email count by year ===")
-yearly_emails = email_df.groupby(email_df['sentDate'].dt.year).size()
+sent_years, year_counts = np.unique(sent_ms.astype('datetime64[ms]').astype('datetime64[Y]'),
+                                    return_counts=True)
+yearly_emails = pd.Series(year_counts, index=sent_years.astype('int64') + 1970)
 print(yearly_emails)
 
 # Save converted DataFrame
 print("\n=== Saving converted data ===")
-email_df.to_csv('emails_split_datetime.csv', index=False, encoding='utf-8')
-print("Converted data saved to 'emails_split_datetime.csv' file.")
+# json_normalize can leave object columns mixing types (str and list, int and str);
+# Arrow needs one type per column, so store those as text (lists/dicts as JSON)
+for column in email_df.columns[email_df.dtypes == object]:
+    try:
+        pa.array(email_df[column], from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        email_df[column] = email_df[column].map(
+            lambda v: json.dumps(v, default=str) if isinstance(v, (list, dict))
+            else v if v is None or (isinstance(v, float) and np.isnan(v)) else str(v)
+        )
+        print(f"Column '{column}' has mixed types - saved as text")
+email_df.to_parquet('emails_split_datetime.parquet', index=False, compression='zstd')
+print("Converted data saved to 'emails_split_datetime.parquet' file.")
 
 # Key statistics summary
 print("\n=== Data summary ===")
@@ -95,6 +132,8 @@ print(f"Read emails: {(email_df['status'] == '1').sum()}")
 
 # Check date range
 print(f"\n=== Date range ===")
-print(f"Oldest email: {email_df['sent_date'].min()}")
-print(f"Most recent email: {email_df['sent_date'].max()}")
-print(f"Total period: {email_df['sent_date'].max() - email_df['sent_date'].min()}") 
\ No newline at end of file
+oldest_date = email_df['sentDate'].min().date()
+newest_date = email_df['sentDate'].max().date()
+print(f"Oldest email: {oldest_date}")
+print(f"Most recent email: {newest_date}")
+print(f"Total period: {newest_date - oldest_date}") 
\ No newline at end of file
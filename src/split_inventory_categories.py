@@ -13,14 +13,17 @@ sys.path.append('.')
 # Import utility functions
 from data_utils import load_data_files
 
-def split_inventory_categories():
+def split_inventory_categories(verbose: bool = False):
     """
     Load data files and split the Item column into hierarchical categories.
     
     What: Loads inventory data and splits the 'Item' column into multiple hierarchical category columns based on ':' separator.
     Why: Many inventory systems encode category hierarchy in a single string; splitting enables easier analysis and filtering.
-    How: Counts hierarchy depth, splits strings, pads missing levels, and adds new columns. Only shape/columns are printed for privacy.
+    How: Counts hierarchy depth, splits all strings with a vectorized str.split(expand=True) and adds new columns. Only shape/columns are printed for privacy.
     Alternative: Could use regular expressions or a parser for more complex structures, but split(':') is fast and sufficient for this format.
+    
+    Args:
+        verbose: Print the hierarchy analysis (value counts, samples, per-level unique counts); off for pipeline use
     """
     print("Loading data files...")
     df, df2, df3 = load_data_files()
@@ -28,100 +31,86 @@ def split_inventory_categories():
     
     # Remove 'Unnamed: 0' columns first
     print("\nRemoving 'Unnamed: 0' columns...")
-    if 'Unnamed: 0' in df.columns:
-        df = df.drop(columns=['Unnamed: 0'])
-    if 'Unnamed: 0' in df2.columns:
-        df2 = df2.drop(columns=['Unnamed: 0'])
-    if 'Unnamed: 0' in df3.columns:
-        df3 = df3.drop(columns=['Unnamed: 0'])
-    
-    print("=== INVENTORY ITEM CATEGORY ANALYSIS ===")
-    
-    # First, let's examine the Item column structure
-    print("\n--- Item Column Structure Analysis ---")
-    print(f"Total items: {len(df2)}")
-    print(f"Unique items: {df2['Item'].nunique()}")
-    
-    # Sample some items to understand the structure
-    print("\n--- Sample Items ---")
-    sample_items = df2['Item'].dropna().head(10).tolist()
-    for i, item in enumerate(sample_items, 1):
-        print(f"{i}. {item}")
+    df = df.drop(columns=['Unnamed: 0'], errors='ignore')
+    df2 = df2.drop(columns=['Unnamed: 0'], errors='ignore')
+    df3 = df3.drop(columns=['Unnamed: 0'], errors='ignore')
     
-    # Analyze the depth of hierarchy (number of colons)
-    print("\n--- Hierarchy Depth Analysis ---")
-    colon_counts = df2['Item'].str.count(':').value_counts().sort_index()
-    print("Number of colons (hierarchy levels):")
-    for colons, count in colon_counts.items():
-        print(f"  {colons} colons: {count:,} items")
+    # Arrow-backed strings: count/split below run over packed UTF-8 buffers
+    df2['Item'] = df2['Item'].astype('string[pyarrow]')
     
-    # Find the maximum depth
-    max_depth = df2['Item'].str.count(':').max()
-    print(f"\nMaximum hierarchy depth: {max_depth} levels")
+    colon_counts_series = df2['Item'].str.count(':')
+    # Maximum depth (missing items are skipped)
+    max_depth = int(colon_counts_series.max())
     
-    # Split the Item column into hierarchical categories
-    print("\n--- Splitting Item Column ---")
-    
-    # Create a function to split item into categories
-    def split_item_categories(item):
-        """
-        Split item string by ':' and return hierarchical categories
-        """
-        if pd.isna(item):
-            return [None] * (max_depth + 1)
+    if verbose:
+        print("=== INVENTORY ITEM CATEGORY ANALYSIS ===")
+        
+        # First, let's examine the Item column structure
+        print("\n--- Item Column Structure Analysis ---")
+        print(f"Total items: {len(df2)}")
+        print(f"Unique items: {df2['Item'].nunique()}")
+        
+        # Sample some items to understand the structure
+        print("\n--- Sample Items ---")
+        sample_items = df2['Item'].dropna().head(10).tolist()
+        for i, item in enumerate(sample_items, 1):
+            print(f"{i}. {item}")
+        
+        # Analyze the depth of hierarchy (number of colons)
+        print("\n--- Hierarchy Depth Analysis ---")
+        colon_counts = colon_counts_series.value_counts().sort_index()
+        print("Number of colons (hierarchy levels):")
+        for colons, count in colon_counts.items():
+            print(f"  {colons} colons: {count:,} items")
         
-        parts = item.split(':')
-        # Pad with None if not enough parts
-        while len(parts) < max_depth + 1:
-            parts.append(None)
+        print(f"\nMaximum hierarchy depth: {max_depth} levels")
         
-        return parts[:max_depth + 1]
+        # Split the Item column into hierarchical categories
+        print("\n--- Splitting Item Column ---")
     
-    # Apply the splitting function
-    split_items = df2['Item'].apply(split_item_categories)
+    # Split every item at once; rows with fewer levels are padded with missing values
+    split_cols = [f'Category_Level_{i+1}' for i in range(max_depth)] + ['Product_Code']
+    split_items = df2['Item'].str.split(':', n=max_depth, expand=True)
+    split_items.columns = split_cols
+    df2[split_cols] = split_items
     
-    # Create new columns for each level
-    for i in range(max_depth + 1):
-        col_name = f'Category_Level_{i+1}' if i < max_depth else 'Product_Code'
-        df2[col_name] = split_items.apply(lambda x: x[i] if x else None)
+    # Category levels repeat heavily - store them as categoricals
+    for col_name in split_cols[:-1]:
+        df2[col_name] = df2[col_name].astype('category')
     
     print("✓ Item column split into hierarchical categories")
     
-    # Display the new structure
-    print("\n--- New DataFrame Structure ---")
-    print(f"Original columns: {list(df2.columns)}")
-    print(f"New shape: {df2.shape}")
-    
-    # Show sample of the split data
-    print("\n--- Sample Split Data ---")
-    sample_cols = ['Item'] + [f'Category_Level_{i+1}' for i in range(max_depth)] + ['Product_Code']
-    print(df2[sample_cols].head(10).to_string())
-    
-    # Analyze category distribution
-    print("\n--- Category Distribution ---")
-    for i in range(max_depth):
-        col_name = f'Category_Level_{i+1}'
-        unique_categories = df2[col_name].nunique()
-        print(f"{col_name}: {unique_categories:,} unique categories")
-    
-    # Show some examples of the hierarchy
-    print("\n--- Hierarchy Examples ---")
-    for i in range(min(5, len(df2))):
-        item = df2.iloc[i]['Item']
-        if pd.notna(item):
-            print(f"\nItem: {item}")
-            for j in range(max_depth):
-                col_name = f'Category_Level_{j+1}'
-                value = df2.iloc[i][col_name]
-                if pd.notna(value):
-                    print(f"  Level {j+1}: {value}")
-            product_code = df2.iloc[i]['Product_Code']
-            if pd.notna(product_code):
-                print(f"  Product Code: {product_code}")
-    
-    print("\n" + "="*50)
-    print("INVENTORY ITEM CATEGORY ANALYSIS COMPLETED")
-    print("="*50)
+    if verbose:
+        # Display the new structure
+        print("\n--- New DataFrame Structure ---")
+        print(f"Original columns: {list(df2.columns)}")
+        print(f"New shape: {df2.shape}")
+        
+        # Show sample of the split data
+        print("\n--- Sample Split Data ---")
+        sample_cols = ['Item'] + split_cols
+        print(df2[sample_cols].head(10).to_string())
+        
+        # Analyze category distribution
+        print("\n--- Category Distribution ---")
+        for col_name in split_cols[:-1]:
+            unique_categories = df2[col_name].cat.categories.size
+            print(f"{col_name}: {unique_categories:,} unique categories")
+        
+        # Show some examples of the hierarchy
+        print("\n--- Hierarchy Examples ---")
+        for item, *levels, product_code in df2[sample_cols].head(5).itertuples(index=False, name=None):
+            if pd.notna(item):
+                print(f"\nItem: {item}")
+                for j, value in enumerate(levels, 1):
+                    if pd.notna(value):
+                        print(f"  Level {j}: {value}")
+                if pd.notna(product_code):
+                    print(f"  Product Code: {product_code}")
+        
+        print("\n" + "="*50)
+        print("INVENTORY ITEM CATEGORY ANALYSIS COMPLETED")
+        print("="*50)
     
     print(f"df2: {df2.shape}, columns: {list(df2.columns)}")
     return df, df2, df3
@@ -131,11 +120,13 @@ if __name__ == "__main__":
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
     
     # Split inventory categories
-    df, df2, df3 = split_inventory_categories()
+    df, df2, df3 = split_inventory_categories(verbose=True)
     
     # Save the processed inventory data
     print("\nSaving processed inventory data...")
-    df2.to_csv('../data/processed_inventory_with_categories.csv', index=False)
-    print("✓ Processed inventory data saved to '../data/processed_inventory_with_categories.csv'")
+    # Output-only file (nothing in the repo reads it back); Feather (Arrow IPC) preserves
+    # the string[pyarrow]/categorical dtypes for anyone loading it with pd.read_feather
+    df2.to_feather('../data/processed_inventory_with_categories.feather', compression='zstd')
+    print("✓ Processed inventory data saved to '../data/processed_inventory_with_categories.feather'")
     
     print("\nInventory category splitting completed successfully!") 
\ No newline at end of file
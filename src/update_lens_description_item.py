@@ -1,75 +1,88 @@
 import pandas as pd
 import numpy as np
 
-def update_lens_description_item(inv_df):
+def update_lens_description_item(inv_df, inplace=False):
     """
     When Category_Level_1 is 'lens',
     merge Category_Level_2 and Category_Level_3 to
     overwrite Description and Item columns
+    
+    With inplace=False only the two overwritten columns are copied;
+    inv_df itself is left unchanged.
+    
+    Returns (df, lens_df): the updated frame and its updated lens rows,
+    so callers don't have to filter df again.
     """
     
-    # Copy data
-    df = inv_df.copy()
+    if inplace:
+        df = inv_df
+    else:
+        # Shallow copy; replace just the columns that get overwritten with real copies
+        df = inv_df.copy(deep=False)
+        df['Description'] = inv_df['Description'].copy()
+        df['Item'] = inv_df['Item'].copy()
     
     # Filter only lens data
     lens_mask = df['Category_Level_1'] == 'lens'
-    lens_df = df[lens_mask].copy()
-    
-    print(f"Lens data: {len(lens_df)} rows")
+    lens_levels = df.loc[lens_mask, ['Category_Level_2', 'Category_Level_3']]
     
-    # Merge Category_Level_2 and Category_Level_3
-    def merge_cat2_cat3(row):
-        cat2 = str(row['Category_Level_2']) if pd.notna(row['Category_Level_2']) else ''
-        cat3 = str(row['Category_Level_3']) if pd.notna(row['Category_Level_3']) else ''
-        merged = (cat2 + ' ' + cat3).strip()
-        return merged
+    print(f"Lens data: {len(lens_levels)} rows")
     
-    # Generate merged string
-    merged_values = lens_df.apply(merge_cat2_cat3, axis=1)
+    # Merge Category_Level_2 and Category_Level_3 (missing values become '')
+    # Arrow-backed strings keep the concat/strip in compiled kernels on any pandas version
+    cat2 = lens_levels['Category_Level_2'].astype('string[pyarrow]').fillna('')
+    cat3 = lens_levels['Category_Level_3'].astype('string[pyarrow]').fillna('')
+    merged_values = (cat2 + ' ' + cat3).str.strip()
     
-    # Overwrite Description and Item columns
-    df.loc[lens_mask, 'Description'] = merged_values.values
-    df.loc[lens_mask, 'Item'] = merged_values.values
+    # Overwrite Description and Item columns from one shared buffer
+    merged_array = merged_values.to_numpy()
+    df.loc[lens_mask, 'Description'] = merged_array
+    df.loc[lens_mask, 'Item'] = merged_array
     
     print("Lens data Description and Item columns update completed")
     
+    # Updated lens rows, selected once and handed back to the caller
+    lens_df = df.loc[lens_mask]
+    
     # Check results
     print("\n=== Update Result Sample ===")
-    updated_lens = df[lens_mask][['item_code', 'Item', 'Description', 'Category_Level_1', 'Category_Level_2', 'Category_Level_3']].head(10)
+    updated_lens = lens_df[['item_code', 'Item', 'Description', 'Category_Level_1', 'Category_Level_2', 'Category_Level_3']].head(10)
     print(updated_lens)
     
-    return df
+    return df, lens_df
 
 def main():
     # Load data (modified to current file path)
     try:
         # First check if cleaned file exists
-        inv_df = pd.read_csv('data/inventory_final_anonymous_cleaned.csv')
+        inv_df = pd.read_csv('data/inventory_final_anonymous_cleaned.csv', engine='pyarrow')
         print("Cleaned file loaded successfully")
     except:
         # If not, load original file
-        inv_df = pd.read_csv('data/inventory_final_anonymous.csv')
+        inv_df = pd.read_csv('data/inventory_final_anonymous.csv', engine='pyarrow')
         print("Original file loaded successfully")
     
     print(f"Total data: {len(inv_df)} rows")
     print(f"Columns: {list(inv_df.columns)}")
     
+    # Categorical level 1: 'lens' comparisons become integer code compares
+    inv_df['Category_Level_1'] = inv_df['Category_Level_1'].astype('category')
+    
     # Check lens data
-    lens_count = len(inv_df[inv_df['Category_Level_1'] == 'lens'])
+    lens_count = (inv_df['Category_Level_1'] == 'lens').sum()
     print(f"Lens data: {lens_count} rows")
     
-    # Execute update
-    updated_df = update_lens_description_item(inv_df)
+    # Execute update (inv_df is not used afterwards, so update it in place)
+    updated_df, lens_df = update_lens_description_item(inv_df, inplace=True)
     
     # Save results
-    output_file = 'data/inventory_final_anonymous_updated.csv'
-    updated_df.to_csv(output_file, index=False)
+    output_file = 'data/inventory_final_anonymous_updated.parquet'
+    updated_df.to_parquet(output_file, index=False, compression='zstd')
     print(f"\nUpdated data saved successfully: {output_file}")
     
     # Save lens data separately
-    lens_df = updated_df[updated_df['Category_Level_1'] == 'lens']
-    lens_output_file = 'data/lens_data_updated.csv'
-    lens_df.to_csv(lens_output_file, index=False)
+    lens_output_file = 'data/lens_data_updated.parquet'
+    lens_df.to_parquet(lens_output_file, index=False, compression='zstd')
     print(f"Lens data saved successfully: {lens_output_file}")
 
 if __name__ == "__main__":